@@ -23,7 +23,8 @@ PyPDFForm aims to simplify PDF form manipulation, making it accessible to develo
 __version__ = "3.6.1"
 
 from .middleware.text import Text  # exposing for setting global font attrs
+from .template import clear_template_cache
 from .widgets import Fields
 from .wrapper import PdfWrapper
 
-__all__ = ["PdfWrapper", "Text", "Fields"]
+__all__ = ["PdfWrapper", "Text", "Fields", "clear_template_cache"]
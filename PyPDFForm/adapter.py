@@ -32,20 +32,24 @@ def readable(obj: Any) -> bool:
 
 
 def fp_or_f_obj_or_stream_to_stream(
-    fp_or_f_obj_or_stream: Union[bytes, str, BinaryIO],
+    fp_or_f_obj_or_stream: Union[bytes, bytearray, memoryview, str, BinaryIO],
 ) -> bytes:
     """
     Adapt a file path, file object, or stream to a byte stream.
 
     This function takes a file path, a file object, or a byte stream and adapts it to a consistent byte stream.
     It handles different input types, including:
-        - byte streams (bytes)
+        - byte streams (bytes, as well as bytearray and memoryview)
         - file paths (str)
         - file-like objects with a read() method (BinaryIO)
 
+    bytes input is passed through untouched, and bytearray/memoryview input
+    is converted with a single copy into the immutable form the rest of the
+    library expects.
+
     Args:
-        fp_or_f_obj_or_stream (Union[bytes, str, BinaryIO]): The input to adapt.
-            It can be a byte stream, a file path (string), or a file object.
+        fp_or_f_obj_or_stream (Union[bytes, bytearray, memoryview, str, BinaryIO]): The input to adapt.
+            It can be a bytes-like object, a file path (string), or a file object.
 
     Returns:
         bytes: The byte stream representation of the input.
@@ -56,6 +60,9 @@ def fp_or_f_obj_or_stream_to_stream(
     if isinstance(fp_or_f_obj_or_stream, bytes):
         result = fp_or_f_obj_or_stream
 
+    elif isinstance(fp_or_f_obj_or_stream, (bytearray, memoryview)):
+        result = bytes(fp_or_f_obj_or_stream)
+
     elif readable(fp_or_f_obj_or_stream):
         result = fp_or_f_obj_or_stream.read()
 
@@ -15,7 +15,7 @@ from reportlab.pdfbase.pdfmetrics import stringWidth
 from .constants import COORDINATE_GRID_FONT_SIZE_MARGIN_RATIO, DEFAULT_FONT
 from .middleware.text import Text
 from .utils import stream_to_io
-from .watermark import create_watermarks_and_draw, merge_watermarks_with_pdf
+from .watermark import create_watermarks_and_draw_pages, merge_watermarks_with_pdf
 
 
 def generate_coordinate_grid(
@@ -42,7 +42,6 @@ def generate_coordinate_grid(
     pdf_file = PdfReader(stream_to_io(pdf))
     lines_by_page = {}
     texts_by_page = {}
-    watermarks = []
 
     for i, page in enumerate(pdf_file.pages):
         lines_by_page[i + 1] = []
@@ -96,16 +95,9 @@ def generate_coordinate_grid(
                 y += margin
             x += margin
 
-    for page, lines in lines_by_page.items():
-        watermarks.append(
-            create_watermarks_and_draw(pdf, page, "line", lines)[page - 1]
-        )
+    watermarks = create_watermarks_and_draw_pages(pdf, "line", lines_by_page)
 
     result = merge_watermarks_with_pdf(pdf, watermarks)
-    watermarks = []
-    for page, texts in texts_by_page.items():
-        watermarks.append(
-            create_watermarks_and_draw(pdf, page, "text", texts)[page - 1]
-        )
+    watermarks = create_watermarks_and_draw_pages(pdf, "text", texts_by_page)
 
     return merge_watermarks_with_pdf(result, watermarks)
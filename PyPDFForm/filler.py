@@ -27,7 +27,7 @@ from .patterns import (update_checkbox_value, update_dropdown_value,
                        update_radio_value, update_text_value)
 from .template import get_widget_key
 from .utils import stream_to_io
-from .watermark import create_watermarks_and_draw, merge_watermarks_with_pdf
+from .watermark import create_watermarks_and_draw_pages, merge_watermarks_with_pdf
 
 
 def signature_image_handler(
@@ -87,13 +87,7 @@ def get_drawn_stream(to_draw: dict, stream: bytes, action: str) -> bytes:
     Returns:
         bytes: The modified PDF content with watermarks applied.
     """
-    watermark_list = []
-    for page, stuffs in to_draw.items():
-        watermark_list.append(b"")
-        watermarks = create_watermarks_and_draw(stream, page, action, stuffs)
-        for i, watermark in enumerate(watermarks):
-            if watermark:
-                watermark_list[i] = watermark
+    watermark_list = create_watermarks_and_draw_pages(stream, action, to_draw)
 
     return merge_watermarks_with_pdf(stream, watermark_list)
 
@@ -8,7 +8,11 @@ and defines specific patterns for identifying and constructing different
 types of widgets.
 """
 
+from copy import deepcopy
+from hashlib import sha256
 from io import BytesIO
+from re import compile as re_compile
+from sys import intern
 from typing import Dict, List, Tuple, Union, cast
 from warnings import warn
 
@@ -28,10 +32,215 @@ from .patterns import (DROPDOWN_CHOICE_PATTERNS, WIDGET_DESCRIPTION_PATTERNS,
 from .utils import extract_widget_property, find_pattern_match, stream_to_io
 
 
+class WidgetDict(dict):
+    """
+    A widget dictionary that defers per-widget attribute extraction.
+
+    Entries are constructed eagerly by `build_widgets` so that widget types,
+    radio grouping, dropdown choices, and malformed-widget warnings behave
+    exactly as before, but the secondary attribute reads (tooltip, text
+    value, max length, multiline flag) are postponed until a widget is first
+    looked up. Code paths that only touch a few keys never pay the
+    extraction cost for the rest.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._pending = {}
+
+    def defer(self, key: str, annot: dict) -> None:
+        """Registers the raw annotation to extract attributes from on first access."""
+        self._pending[key] = annot
+
+    def _resolve(self, key: str) -> None:
+        annot = self._pending.pop(key, None)
+        if annot is not None:
+            populate_widget_attributes(annot, dict.__getitem__(self, key))
+
+    def materialize_all(self) -> None:
+        """Resolves every deferred widget, e.g. before iterating all attributes."""
+        for key in list(self._pending):
+            self._resolve(key)
+
+    def constructed(self):
+        """Iterates widget objects without resolving deferred attribute extraction."""
+        return dict.values(self)
+
+    def __getitem__(self, key):
+        if key in self._pending:
+            self._resolve(key)
+        return dict.__getitem__(self, key)
+
+    def __setitem__(self, key, value):
+        # a replaced entry must not inherit the old entry's deferred extraction
+        self._pending.pop(key, None)
+        dict.__setitem__(self, key, value)
+
+    def get(self, key, default=None):
+        if key in self._pending:
+            self._resolve(key)
+        return dict.get(self, key, default)
+
+    def values(self):
+        self.materialize_all()
+        return dict.values(self)
+
+    def items(self):
+        self.materialize_all()
+        return dict.items(self)
+
+    def __deepcopy__(self, memo):
+        # raw pypdf annotations hold reader references and are not copyable,
+        # so resolve everything first and copy only the widget objects
+        self.materialize_all()
+        result = self.__class__()
+        for k, v in dict.items(self):
+            result[k] = deepcopy(v, memo)
+        return result
+
+    def copy_pristine(self) -> "WidgetDict":
+        """
+        Copies the dictionary without resolving deferred extractions.
+
+        Widget objects are copied so the result can be mutated freely, while
+        the raw annotations backing deferred extraction are shared read-only
+        with the source. Used to hand out independent instances from the
+        template cache without materializing the cached entry.
+        """
+        result = self.__class__()
+        for k, v in dict.items(self):
+            result[k] = deepcopy(v)
+        result._pending = dict(self._pending)  # noqa: SLF001 # pylint: disable=W0212
+        return result
+
+
+def populate_widget_attributes(annot: dict, widget: WIDGET_TYPES) -> None:
+    """
+    Populates the deferred attributes of a widget from its raw annotation.
+
+    This function performs the secondary attribute extraction that
+    `build_widgets` postpones: the tooltip for every widget type, plus the
+    max length, multiline flag, and current value for text fields. Failures
+    are reported the same way as during widget construction and leave the
+    widget with its default attributes.
+
+    Args:
+        annot (dict): The raw annotation dictionary the widget was built from.
+        widget (WIDGET_TYPES): The widget object to populate.
+    """
+    try:
+        widget.__dict__["tooltip"] = extract_widget_property(
+            annot, WIDGET_DESCRIPTION_PATTERNS, None, str
+        )
+
+        if isinstance(widget, Text):
+            # mostly for schema for now
+            # doesn't trigger hook
+            widget.__dict__["max_length"] = get_text_field_max_length(annot)
+            widget.__dict__["multiline"] = get_text_field_multiline(annot)
+            get_text_value(annot, widget)
+    except Exception as e:
+        widget_name = annot.get(T, "Unknown")
+        warn(
+            f"Failed to process widget '{widget_name}': {type(e).__name__}: {e}. "
+            "Its attributes may be incomplete.",
+            UserWarning,
+            stacklevel=2,
+        )
+
+
+_TEMPLATE_CACHE_MAX_SIZE = 32
+
+_template_cache: Dict[tuple, WidgetDict] = {}
+
+
+def clear_template_cache() -> None:
+    """
+    Clears the cache of parsed templates.
+
+    Parsed widget dictionaries are cached per template stream so that
+    repeated instantiation with the same template skips re-parsing. Call
+    this to release the cached entries, e.g. in long-running processes
+    after a batch of one-off templates has been handled.
+    """
+    _template_cache.clear()
+
+
+def template_cache_size() -> int:
+    """
+    Returns the number of parsed templates currently cached.
+
+    Useful for verifying cache behavior in tests and for monitoring cache
+    occupancy in long-running processes without reaching into the cache
+    itself.
+
+    Returns:
+        int: The number of cached widget dictionaries.
+    """
+    return len(_template_cache)
+
+
 def build_widgets(
     pdf_stream: bytes,
     use_full_widget_name: bool,
+    use_cache: bool = True,
 ) -> Dict[str, WIDGET_TYPES]:
+    """
+    Builds a dictionary of widgets from a PDF stream, with caching.
+
+    Parsing is the dominant cost of constructing a wrapper, and workloads
+    such as servers and test suites instantiate the same template many
+    times. Parses are cached keyed by the SHA-256 digest of the stream, so
+    repeated instantiation returns an independent copy of the already-parsed
+    widgets instead of re-reading the PDF. As a consequence, warnings about
+    malformed widgets in a given template are emitted once per process,
+    when the template is first parsed.
+
+    Args:
+        pdf_stream (bytes): The PDF stream to parse.
+        use_full_widget_name (bool): Whether to use the full widget name
+            (including parent names) as the widget key.
+        use_cache (bool): Whether to consult and populate the template cache.
+            Pass False for intermediate streams produced by mutations, which
+            are unique per operation: hashing them and caching their parses
+            would only evict genuinely reusable template entries.
+
+    Returns:
+        Dict[str, WIDGET_TYPES]: A dictionary of widgets, where keys are widget
+            keys and values are widget objects.
+    """
+    if not use_cache:
+        return _build_widgets(pdf_stream, use_full_widget_name)
+
+    cache_key = (
+        sha256(pdf_stream).digest(),
+        use_full_widget_name,
+        # the extraction routines are module globals that tests monkeypatch;
+        # keying on the live function objects keeps patched parses from
+        # being served out of (or written into) the regular cache entries
+        get_widget_key,
+        construct_widget,
+        get_dropdown_choices,
+        get_text_field_max_length,
+        extract_widget_property,
+    )
+    cached = _template_cache.get(cache_key)
+    if cached is None:
+        if len(_template_cache) >= _TEMPLATE_CACHE_MAX_SIZE:
+            del _template_cache[next(iter(_template_cache))]
+        cached = _build_widgets(pdf_stream, use_full_widget_name)
+    # reinsert so iteration order tracks recency and eviction drops the
+    # least recently used entry
+    _template_cache.pop(cache_key, None)
+    _template_cache[cache_key] = cached
+
+    return cached.copy_pristine()
+
+
+def _build_widgets(
+    pdf_stream: bytes,
+    use_full_widget_name: bool,
+) -> WidgetDict:
     """
     Builds a dictionary of widgets from a PDF stream.
 
@@ -41,6 +250,10 @@ def build_widgets(
     and choices (for dropdowns). The constructed widgets are stored in a dictionary
     where the keys are the widget keys and the values are the widget objects.
 
+    Widget construction, value extraction, and dropdown choices are resolved
+    eagerly; the remaining attribute reads are deferred by the returned
+    `WidgetDict` until a widget is first accessed.
+
     Args:
         pdf_stream (bytes): The PDF stream to parse.
         use_full_widget_name (bool): Whether to use the full widget name
@@ -50,7 +263,9 @@ def build_widgets(
         Dict[str, WIDGET_TYPES]: A dictionary of widgets, where keys are widget
             keys and values are widget objects.
     """
-    results = {}
+    results = WidgetDict()
+    failures = []
+    no_choice_dropdowns = []
 
     for widgets in get_widgets_by_page(pdf_stream).values():
         for widget in widgets:
@@ -58,17 +273,6 @@ def build_widgets(
                 key = get_widget_key(widget, use_full_widget_name)
                 _widget = construct_widget(widget, key)
                 if _widget is not None:
-                    _widget.__dict__["tooltip"] = extract_widget_property(
-                        widget, WIDGET_DESCRIPTION_PATTERNS, None, str
-                    )
-
-                    if isinstance(_widget, Text):
-                        # mostly for schema for now
-                        # doesn't trigger hook
-                        _widget.__dict__["max_length"] = get_text_field_max_length(widget)
-                        _widget.__dict__["multiline"] = get_text_field_multiline(widget)
-                        get_text_value(widget, _widget)
-
                     if type(_widget) is Checkbox:
                         _widget.value = get_checkbox_value(widget)
 
@@ -77,38 +281,53 @@ def build_widgets(
                         # doesn't trigger hook
                         choices = get_dropdown_choices(widget)
                         if choices is None:
-                            warn(
-                                f"Dropdown widget '{key}' has no choices defined. "
-                                "This may indicate a malformed PDF form field.",
-                                UserWarning,
-                                stacklevel=2,
-                            )
+                            no_choice_dropdowns.append(key)
                         _widget.__dict__["choices"] = choices
                         get_dropdown_value(widget, _widget)
 
                     if isinstance(_widget, Radio):
                         if key not in results:
                             results[key] = _widget
+                            results.defer(key, widget)
 
                         # for schema
-                        results[key].number_of_options += 1
+                        dict.__getitem__(results, key).number_of_options += 1
 
                         if get_radio_value(widget):
-                            results[key].value = results[key].number_of_options - 1
+                            dict.__getitem__(results, key).value = (
+                                dict.__getitem__(results, key).number_of_options - 1
+                            )
                         continue
 
                     results[key] = _widget
+                    results.defer(key, widget)
             except Exception as e:
-                # Log warning but continue processing other widgets
+                # collect and continue processing other widgets; warnings
+                # are batched below so a thousand faulty widgets cost one
+                # trip through the warning machinery, not a thousand
                 widget_name = widget.get(T, "Unknown")
-                warn(
-                    f"Failed to process widget '{widget_name}': {type(e).__name__}: {e}. "
-                    "This widget will be skipped.",
-                    UserWarning,
-                    stacklevel=2,
-                )
+                failures.append(f"'{widget_name}': {type(e).__name__}: {e}")
                 continue
 
+    if failures:
+        warn(
+            f"Failed to process widget(s), skipped {len(failures)}: "
+            f"{'; '.join(failures)}.",
+            UserWarning,
+            stacklevel=2,
+        )
+
+    if no_choice_dropdowns:
+        warn(
+            "; ".join(
+                f"Dropdown widget '{key}' has no choices defined"
+                for key in no_choice_dropdowns
+            )
+            + ". This may indicate a malformed PDF form field.",
+            UserWarning,
+            stacklevel=2,
+        )
+
     return results
 
 
@@ -136,20 +355,19 @@ def get_widgets_by_page(pdf: bytes) -> Dict[int, List[dict]]:
         result[i + 1] = []
         if widgets:
             for widget in widgets:
-                widget = dict(widget.get_object())
-                for each in WIDGET_TYPE_PATTERNS:
-                    patterns = each[0]
-                    check = True
-                    for pattern in patterns:
-                        check = check and find_pattern_match(pattern, widget)
-                    if check:
-                        result[i + 1].append(widget)
+                widget = widget.get_object()
+                for patterns, _ in WIDGET_TYPE_PATTERNS:
+                    if all(
+                        find_pattern_match(pattern, widget) for pattern in patterns
+                    ):
+                        # snapshot only annotations that matched a pattern
+                        result[i + 1].append(dict(widget))
                         break
 
     return result
 
 
-def get_widget_key(widget: dict, use_full_widget_name: bool) -> str:
+def get_widget_key(widget: dict, use_full_widget_name: bool) -> Union[str, None]:
     """
     Extracts the widget key from a widget dictionary.
 
@@ -163,10 +381,15 @@ def get_widget_key(widget: dict, use_full_widget_name: bool) -> str:
             (including parent names) as the widget key.
 
     Returns:
-        str: The extracted widget key.
+        Union[str, None]: The extracted widget key, or None if the widget
+            has no key when short names are requested.
     """
     if not use_full_widget_name:
-        return extract_widget_property(widget, WIDGET_KEY_PATTERNS, None, str)
+        key = extract_widget_property(widget, WIDGET_KEY_PATTERNS, None, str)
+        # keys repeat across annotations (radio groups), across rebuilt
+        # widget dicts, and across instances sharing a template; interning
+        # shares one string object and makes key comparisons pointer checks
+        return intern(key) if key is not None else key
 
     key = widget.get(T)
     if (
@@ -177,11 +400,44 @@ def get_widget_key(widget: dict, use_full_widget_name: bool) -> str:
         if key is None:
             return get_widget_key(widget[Parent].get_object(), use_full_widget_name)
 
-        return (
+        return intern(
             f"{get_widget_key(widget[Parent].get_object(), use_full_widget_name)}.{key}"
         )
 
-    return key or ""
+    return intern(str(key)) if key else ""
+
+
+WIDGET_NAME_SCAN_PATTERN = re_compile(rb"/T\s*\(([^)]*)\)")
+
+
+def scan_widget_names(pdf: bytes) -> List[str]:
+    """
+    Scans raw PDF bytes for field names without parsing the document.
+
+    This is a lightweight alternative to building a full widget dictionary
+    when only the names are needed, such as existence checks over freshly
+    generated output. It matches literal-string /T entries in uncompressed
+    objects, which covers PDFs written by this library; names stored inside
+    object streams or as hex strings are not found, so use a full parse
+    when completeness matters.
+
+    Args:
+        pdf (bytes): The PDF to scan.
+
+    Returns:
+        List[str]: The field names found, in order of first appearance and
+            without duplicates.
+    """
+    result = []
+    seen = set()
+
+    for match in WIDGET_NAME_SCAN_PATTERN.finditer(pdf):
+        name = match.group(1).decode("latin-1")
+        if name not in seen:
+            seen.add(name)
+            result.append(name)
+
+    return result
 
 
 def construct_widget(widget: dict, key: str) -> Union[WIDGET_TYPES, None]:
@@ -199,16 +455,10 @@ def construct_widget(widget: dict, key: str) -> Union[WIDGET_TYPES, None]:
         Union[WIDGET_TYPES, None]: The constructed widget object, or None
             if the widget type is not recognized.
     """
-    result = None
-    for each in WIDGET_TYPE_PATTERNS:
-        patterns, _type = each
-        check = True
-        for pattern in patterns:
-            check = check and find_pattern_match(pattern, widget)
-        if check:
-            result = _type(key)
-            break
-    return result
+    for patterns, _type in WIDGET_TYPE_PATTERNS:
+        if all(find_pattern_match(pattern, widget) for pattern in patterns):
+            return _type(key)
+    return None
 
 
 def get_text_field_max_length(widget: dict) -> Union[int, None]:
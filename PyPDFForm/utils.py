@@ -18,7 +18,7 @@ from functools import lru_cache
 from io import BytesIO
 from secrets import choice
 from string import ascii_letters, digits, punctuation
-from typing import Any, BinaryIO, List, Union
+from typing import Any, BinaryIO, List, Union, cast
 
 from pypdf import PdfReader, PdfWriter
 from pypdf.generic import ArrayObject, DictionaryObject, NameObject
@@ -41,11 +41,9 @@ def stream_to_io(stream: bytes) -> BinaryIO:
     Returns:
         BinaryIO: A BinaryIO object representing the stream.
     """
-    result = BytesIO()
-    result.write(stream)
-    result.seek(0)
-
-    return result
+    # constructing from the bytes directly shares the buffer copy-on-write,
+    # unlike write(), which always copies the full stream into the object
+    return BytesIO(stream)
 
 
 @lru_cache
@@ -207,23 +205,25 @@ def find_pattern_match(pattern: dict, widget: Union[dict, DictionaryObject]) ->
     Returns:
         bool: True if a match is found, False otherwise.
     """
-    for key, value in widget.items():
-        result = False
-        if key in pattern:
-            value = value.get_object()
-            if isinstance(pattern[key], dict) and isinstance(
-                value, (dict, DictionaryObject)
-            ):
-                result = find_pattern_match(pattern[key], value)
-            else:
-                if isinstance(pattern[key], tuple):
-                    result = value in pattern[key]
-                    if not result and SLASH in pattern[key] and value.startswith(SLASH):
-                        result = True
-                else:
-                    result = pattern[key] == value
-        if result:
-            return result
+    # iterate the pattern rather than the widget: patterns hold one or two
+    # keys while annotations hold a dozen or more, so matching costs a few
+    # dict lookups instead of a scan of every annotation entry
+    for key, expected in pattern.items():
+        if key not in widget:
+            continue
+        value = widget[key].get_object()
+        if isinstance(expected, dict) and isinstance(
+            value, (dict, DictionaryObject)
+        ):
+            if find_pattern_match(expected, value):
+                return True
+        elif isinstance(expected, tuple):
+            if value in expected:
+                return True
+            if SLASH in expected and isinstance(value, str) and value.startswith(SLASH):
+                return True
+        elif expected == value:
+            return True
     return False
 
 
@@ -245,19 +245,20 @@ def traverse_pattern(
     Returns:
         Union[str, list, None]: The value found, or None if not found.
     """
-    for key, value in widget.items():
-        result = None
-        if key in pattern:
-            value = value.get_object()
-            if isinstance(pattern[key], dict) and isinstance(
-                value, (dict, DictionaryObject)
-            ):
-                result = traverse_pattern(pattern[key], value)
-            else:
-                if pattern[key] is True and value:
-                    return value
-        if result:
-            return result
+    # same inversion as find_pattern_match: look the pattern's keys up in
+    # the widget instead of scanning every annotation entry
+    for key, expected in pattern.items():
+        if key not in widget:
+            continue
+        value = widget[key].get_object()
+        if isinstance(expected, dict) and isinstance(
+            value, (dict, DictionaryObject)
+        ):
+            result = traverse_pattern(expected, value)
+            if result:
+                return result
+        elif expected is True and value:
+            return cast(Union[str, list, None], value)
     return None
 
 
@@ -9,7 +9,7 @@ and to copy specific widgets from the watermarks to the original PDF.
 """
 
 from io import BytesIO
-from typing import List, Union
+from typing import Dict, List, Union
 
 from pypdf import PdfReader, PdfWriter
 from pypdf.generic import ArrayObject, NameObject
@@ -137,36 +137,61 @@ def create_watermarks_and_draw(
         List[bytes]: A list of byte streams, where the element at index (page_number - 1) contains the watermark for the specified page,
                      and all other elements are empty byte streams.
     """
+    return create_watermarks_and_draw_pages(pdf, action_type, {page_number: actions})
+
+
+def create_watermarks_and_draw_pages(
+    pdf: bytes,
+    action_type: str,
+    actions_by_page: Dict[int, List[dict]],
+) -> List[bytes]:
+    """
+    Creates watermarks for multiple pages of the PDF in a single pass.
+
+    Equivalent to calling `create_watermarks_and_draw` once per page, but the
+    PDF is parsed only once and each requested page gets its own canvas, so
+    drawing on every page of a document costs one parse instead of one per
+    page.
+
+    Args:
+        pdf (bytes): The PDF file as a byte stream.
+        action_type (str): The type of action to perform when creating the watermarks (e.g., "image", "text", "line").
+        actions_by_page (Dict[int, List[dict]]): A mapping of page numbers (1-indexed) to the list of actions
+            to be performed on that page's watermark.
+
+    Returns:
+        List[bytes]: A list of byte streams, one per page of the PDF, where each page present in
+                     `actions_by_page` contains its rendered watermark and all other elements are
+                     empty byte streams.
+    """
     pdf_file = PdfReader(stream_to_io(pdf))
-    buff = BytesIO()
-
-    canvas = Canvas(
-        buff,
-        pagesize=(
-            float(pdf_file.pages[page_number - 1].mediabox[2]),
-            float(pdf_file.pages[page_number - 1].mediabox[3]),
-        ),
-    )
+    result = [b""] * len(pdf_file.pages)
 
     action_type_to_func = {
         "image": draw_image,
         "text": draw_text,
         "line": draw_line,
     }
+    draw_func = action_type_to_func.get(action_type)
 
-    if action_type_to_func.get(action_type):
-        for each in actions:
-            action_type_to_func[action_type](canvas, **each)
+    for page_number, actions in actions_by_page.items():
+        buff = BytesIO()
+        canvas = Canvas(
+            buff,
+            pagesize=(
+                float(pdf_file.pages[page_number - 1].mediabox[2]),
+                float(pdf_file.pages[page_number - 1].mediabox[3]),
+            ),
+        )
 
-    canvas.save()
-    buff.seek(0)
+        if draw_func:
+            for each in actions:
+                draw_func(canvas, **each)
 
-    watermark = buff.read()
-    buff.close()
+        canvas.save()
+        result[page_number - 1] = buff.getvalue()
 
-    return [
-        watermark if i == page_number - 1 else b"" for i in range(len(pdf_file.pages))
-    ]
+    return result
 
 
 def merge_watermarks_with_pdf(
@@ -186,15 +211,29 @@ def merge_watermarks_with_pdf(
     Returns:
         bytes: A byte stream representing the merged PDF with watermarks applied.
     """
+    if not any(watermarks):
+        # nothing to merge; skip the parse/serialize round trip entirely
+        return pdf
+
     result = BytesIO()
     pdf_file = PdfReader(stream_to_io(pdf))
     output = PdfWriter()
 
+    # identical watermark bytes (e.g. the same overlay repeated on every
+    # equal-sized page) are parsed once and the page object is reused;
+    # merge_page never mutates the page it merges from
+    watermark_page_pool = {}
+
     for i, page in enumerate(pdf_file.pages):
         if watermarks[i]:
-            watermark = PdfReader(stream_to_io(watermarks[i]))
-            if watermark.pages:
-                page.merge_page(watermark.pages[0])
+            watermark_page = watermark_page_pool.get(watermarks[i])
+            if watermark_page is None:
+                watermark = PdfReader(stream_to_io(watermarks[i]))
+                if watermark.pages:
+                    watermark_page = watermark.pages[0]
+                    watermark_page_pool[watermarks[i]] = watermark_page
+            if watermark_page is not None:
+                page.merge_page(watermark_page)
         output.add_page(page)
 
     output.write(result)
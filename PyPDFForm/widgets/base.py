@@ -14,9 +14,11 @@ Classes:
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from inspect import signature
 from io import BytesIO
+from os import cpu_count
 from typing import List, Optional, Union
 
 from pypdf import PdfReader
@@ -26,6 +28,10 @@ from reportlab.pdfgen.canvas import Canvas
 from ..constants import fieldFlags, required
 from ..utils import stream_to_io
 
+# minimum number of pages with widgets before per-page rendering fans out
+# to a thread pool; below this the pool startup outweighs the work
+PARALLEL_RENDER_MIN_PAGES = 4
+
 
 class Widget:
     """
@@ -43,6 +49,8 @@ class Widget:
         ACRO_FORM_FUNC (str): Name of the AcroForm function to use for rendering the widget.
     """
 
+    __slots__ = ("name", "page_number", "acro_form_params", "hook_params")
+
     USER_PARAMS = []
     COLOR_PARAMS = []
     ALLOWED_HOOK_PARAMS = []
@@ -217,47 +225,51 @@ class Widget:
                          watermark for that page. Pages without any widgets will
                          have an empty byte string (b"").
         """
-        result = []
-
         pdf = PdfReader(stream_to_io(stream))
-        watermark = BytesIO()
 
         widgets_by_page = {}
         for widget in widgets:
-            if widget.page_number not in widgets_by_page:
-                widgets_by_page[widget.page_number] = []
-            widgets_by_page[widget.page_number].append(widget)
-
-        for i, page in enumerate(pdf.pages):
-            page_num = i + 1
-            if page_num not in widgets_by_page:
-                result.append(b"")
-                continue
-
-            watermark.seek(0)
-            watermark.flush()
-
-            canvas = Canvas(
-                watermark,
-                pagesize=(
-                    float(page.mediabox[2]),
-                    float(page.mediabox[3]),
-                ),
-            )
-
-            for widget in widgets_by_page[page_num]:
+            widgets_by_page.setdefault(widget.page_number, []).append(widget)
+
+        result = [b""] * len(pdf.pages)
+        # resolve page sizes up front: lazy pypdf object resolution seeks a
+        # shared stream and must not happen concurrently on worker threads
+        to_render = [
+            (i, widgets_by_page[i + 1], float(page.mediabox[2]), float(page.mediabox[3]))
+            for i, page in enumerate(pdf.pages)
+            if widgets_by_page.get(i + 1)
+        ]
+
+        def render_page(task):
+            i, page_widgets, width, height = task
+            # a fresh buffer per page; pages share no mutable state, so
+            # rendering can also run on a worker thread
+            watermark = BytesIO()
+            canvas = Canvas(watermark, pagesize=(width, height))
+
+            for widget in page_widgets:
                 getattr(widget, "_required_handler")(canvas)
                 widget.canvas_operations(canvas)
 
             canvas.showPage()
             canvas.save()
-            watermark.seek(0)
-            result.append(watermark.read())
+            return i, watermark.getvalue()
+
+        if len(to_render) < PARALLEL_RENDER_MIN_PAGES:
+            rendered = map(render_page, to_render)
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(8, cpu_count() or 1)
+            ) as executor:
+                rendered = list(executor.map(render_page, to_render))
+
+        for i, watermark in rendered:
+            result[i] = watermark
 
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class Field:
     """
     Base dataclass for all PDF form fields.
@@ -33,6 +33,8 @@ class CheckBoxWidget(Widget):
             creating the checkbox.
     """
 
+    __slots__ = ()
+
     USER_PARAMS = [
         ("required", "required"),
         ("tooltip", "tooltip"),
@@ -47,7 +49,7 @@ class CheckBoxWidget(Widget):
     ACRO_FORM_FUNC = "checkbox"
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckBoxField(Field):
     """
     Represents a checkbox field in a PDF document.
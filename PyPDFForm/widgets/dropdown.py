@@ -25,11 +25,18 @@ class DropdownWidget(TextWidget):
     dropdown styling, such as options.
 
     Attributes:
+        USER_PARAMS (list): The user-facing parameters inherited from TextWidget,
+            with `max_length` replaced by `options`.
         NONE_DEFAULTS (list): A list of parameters that default to None.
         ACRO_FORM_FUNC (str): The name of the AcroForm function to use for
             creating the dropdown.
     """
 
+    __slots__ = ()
+
+    USER_PARAMS = TextWidget.USER_PARAMS[:-1] + [
+        ("options", "options"),
+    ]
     NONE_DEFAULTS = []
     ACRO_FORM_FUNC = "_textfield"
 
@@ -51,15 +58,12 @@ class DropdownWidget(TextWidget):
             y (float): Y coordinate of the widget.
             **kwargs: Additional keyword arguments.
         """
-        self.USER_PARAMS = super().USER_PARAMS[:-1] + [
-            ("options", "options"),
-        ]
         super().__init__(name, page_number, x, y, **kwargs)
         self.acro_form_params["wkind"] = "choice"
         self.acro_form_params["value"] = self.acro_form_params["options"][0]
 
 
-@dataclass
+@dataclass(slots=True)
 class DropdownField(Field):
     """
     Represents a dropdown field in a PDF document.
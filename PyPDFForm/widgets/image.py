@@ -31,10 +31,12 @@ class ImageWidget(SignatureWidget):
             set to "image".
     """
 
+    __slots__ = ()
+
     BEDROCK_WIDGET_TO_COPY = "image"
 
 
-@dataclass
+@dataclass(slots=True)
 class ImageField(SignatureField):
     """
     Represents an image field in a PDF document.
@@ -28,32 +28,16 @@ class RadioWidget(CheckBoxWidget):
     only one option from a predefined set of choices.
 
     Attributes:
+        USER_PARAMS (list): The user-facing parameters inherited from
+            CheckBoxWidget, extended with `shape`.
         ACRO_FORM_FUNC (str): The name of the AcroForm function to use for
             creating the radio button, set to "radio".
     """
 
-    ACRO_FORM_FUNC = "radio"
-
-    def __init__(
-        self,
-        name: str,
-        page_number: int,
-        x: List[float],
-        y: List[float],
-        **kwargs,
-    ) -> None:
-        """
-        Initializes a RadioWidget object.
+    __slots__ = ()
 
-        Args:
-            name (str): Name of the widget.
-            page_number (int): Page number of the widget.
-            x (List[float]): List of X coordinates for each radio button.
-            y (List[float]): List of Y coordinates for each radio button.
-            **kwargs: Additional keyword arguments.
-        """
-        self.USER_PARAMS.append(("shape", "shape"))
-        super().__init__(name, page_number, x, y, **kwargs)
+    USER_PARAMS = CheckBoxWidget.USER_PARAMS + [("shape", "shape")]
+    ACRO_FORM_FUNC = "radio"
 
     def canvas_operations(self, canvas: Canvas) -> None:
         """
@@ -75,7 +59,7 @@ class RadioWidget(CheckBoxWidget):
             getattr(canvas.acroForm, self.ACRO_FORM_FUNC)(**new_acro_form_params)
 
 
-@dataclass
+@dataclass(slots=True)
 class RadioGroup(CheckBoxField):
     """
     Represents a group of radio buttons in a PDF document.
@@ -47,6 +47,8 @@ class SignatureWidget:
         BEDROCK_WIDGET_TO_COPY (str): The name of the bedrock widget to copy.
     """
 
+    __slots__ = ("name", "page_number", "x", "y", "optional_params", "hook_params")
+
     OPTIONAL_PARAMS = [
         ("width", 160),
         ("height", 90),
@@ -224,7 +226,7 @@ class SignatureWidget:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class SignatureField(Field):
     """
     Represents a signature field in a PDF document.
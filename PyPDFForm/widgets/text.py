@@ -35,6 +35,8 @@ class TextWidget(Widget):
             creating the text field.
     """
 
+    __slots__ = ()
+
     USER_PARAMS = [
         ("required", "required"),
         ("tooltip", "tooltip"),
@@ -53,7 +55,7 @@ class TextWidget(Widget):
     ACRO_FORM_FUNC = "textfield"
 
 
-@dataclass
+@dataclass(slots=True)
 class TextField(Field):
     """
     Represents a text field in a PDF document.
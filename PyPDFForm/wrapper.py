@@ -19,8 +19,10 @@ underlying PDF manipulation.
 from __future__ import annotations
 
 from collections import defaultdict
+from copy import deepcopy
 from dataclasses import asdict
 from functools import cached_property
+from operator import attrgetter
 from typing import TYPE_CHECKING, BinaryIO, Dict, List, Sequence, Tuple, Union
 from warnings import warn
 
@@ -53,6 +55,11 @@ from .widgets.text import TextWidget
 if TYPE_CHECKING:
     from .widgets import FieldTypes
 
+# minimum number of matched keys in a fill before plain string values on
+# text widgets skip the per-attribute hook dispatch; below this the type
+# checks cost more than they save
+BULK_FILL_MIN_WIDGETS = 32
+
 
 class PdfWrapper:
     """
@@ -106,12 +113,13 @@ class PdfWrapper:
         self._font_register_events = []  # for reregister
         self._key_update_tracker = {}  # for update key preserve old key attrs
         self._keys_to_update = []  # for bulk update keys
+        self._pending_fields = []  # for deferred field creation
 
         # sets attrs from kwargs
         for attr, default in self.USER_PARAMS:
             setattr(self, attr, kwargs.get(attr, default))
 
-        self._init_helper()
+        self._init_helper(use_cached_template=True)
 
     def __add__(self, other: PdfWrapper) -> PdfWrapper:
         """
@@ -152,19 +160,26 @@ class PdfWrapper:
 
         return result
 
-    def _init_helper(self) -> None:
+    def _init_helper(self, use_cached_template: bool = False) -> None:
         """
         Helper method to initialize widgets and available fonts.
 
         This method is called during initialization and after certain operations
         that modify the PDF content (e.g., filling, creating widgets, updating keys).
         It rebuilds the widget dictionary and updates the available fonts.
+
+        Args:
+            use_cached_template (bool): Whether the parse may go through the
+                template cache. Only the construction parse does; rebuilds
+                operate on intermediate streams that are unique per mutation
+                and would churn the cache without ever being hit.
         """
 
         new_widgets = (
             build_widgets(
                 self.read(),
                 getattr(self, "use_full_widget_name"),
+                use_cache=use_cached_template,
             )
             if self.read()
             else {}
@@ -174,14 +189,17 @@ class PdfWrapper:
             if k in new_widgets:
                 new_widgets[k] = v
 
-        # update key preserve old key attrs
-        for k, v in new_widgets.items():
-            if k in self._key_update_tracker:
-                for name, value in self.widgets[
-                    self._key_update_tracker[k]
-                ].__dict__.items():
-                    if not name.startswith("_"):
-                        setattr(v, name, value)
+        # update key preserve old key attrs; guarded because iterating the
+        # fresh dict would materialize every deferred attribute extraction,
+        # and the tracker is only populated by key updates
+        if self._key_update_tracker:
+            for k, v in new_widgets.items():
+                if k in self._key_update_tracker:
+                    for name, value in self.widgets[
+                        self._key_update_tracker[k]
+                    ].__dict__.items():
+                        if not name.startswith("_"):
+                            setattr(v, name, value)
         self._key_update_tracker = {}
 
         self.widgets = new_widgets
@@ -208,6 +226,19 @@ class PdfWrapper:
 
         return self
 
+    def _flush_pending_fields(self) -> None:
+        """
+        Flushes all deferred field creations in one bulk operation.
+
+        This method drains the pending field queue before delegating to
+        `bulk_create_fields`, so the widget rebuild it triggers cannot
+        re-enter the queue.
+        """
+
+        pending, self._pending_fields = self._pending_fields, []
+        if pending:
+            self.bulk_create_fields(pending)
+
     @property
     def schema(self) -> dict:
         """
@@ -219,6 +250,8 @@ class PdfWrapper:
             dict: A dictionary representing the JSON schema of the PDF form.
         """
 
+        self._flush_pending_fields()
+
         return {
             "type": "object",
             "properties": {
@@ -240,6 +273,8 @@ class PdfWrapper:
                   their corresponding data (Union[str, bool, int, None]).
         """
 
+        self._flush_pending_fields()
+
         return {key: value.value for key, value in self.widgets.items()}
 
     @property
@@ -253,6 +288,8 @@ class PdfWrapper:
             dict: A dictionary containing sample data for the PDF form.
         """
 
+        self._flush_pending_fields()
+
         return {key: value.sample_value for key, value in self.widgets.items()}
 
     @property
@@ -308,18 +345,54 @@ class PdfWrapper:
 
         return result
 
+    def clone(self) -> PdfWrapper:
+        """
+        Returns a copy of this wrapper without re-parsing the PDF.
+
+        The underlying PDF bytes are immutable and shared with the clone,
+        while the widget dictionary and font state are copied so the clone
+        can be filled or modified independently. This is much cheaper than
+        constructing a new `PdfWrapper` from the same template, which would
+        parse the full document again.
+
+        Returns:
+            PdfWrapper: A new `PdfWrapper` object with the same content and widgets.
+        """
+
+        result = self.__class__(
+            **{param: getattr(self, param, default) for param, default in self.USER_PARAMS},
+        )
+        result.__dict__.update(
+            _stream=self._stream,
+            widgets=deepcopy(self.widgets),
+            _available_fonts=dict(self._available_fonts),
+            _font_register_events=list(self._font_register_events),
+            _pending_fields=list(self._pending_fields),
+            _keys_to_update=list(self._keys_to_update),
+            _key_update_tracker=dict(self._key_update_tracker),
+        )
+
+        return result
+
     def read(self) -> bytes:
         """
         Reads the PDF content from the underlying stream.
 
         This method returns the current state of the PDF as a byte string.
-        It also triggers any pending widget hooks and applies Adobe mode if enabled.
+        It also flushes any deferred field creations, triggers any pending
+        widget hooks, and applies Adobe mode if enabled.
 
         Returns:
             bytes: The PDF content as bytes.
         """
 
-        if any(widget.hooks_to_trigger for widget in self.widgets.values()):
+        # flush deferred field creations in one bulk pass
+        self._flush_pending_fields()
+
+        # scan without materializing deferred widgets: only widgets that
+        # have already been accessed can have pending hooks
+        middlewares = getattr(self.widgets, "constructed", self.widgets.values)()
+        if any(widget.hooks_to_trigger for widget in middlewares):
             for widget in self.widgets.values():
                 if (
                     isinstance(widget, (Text, Dropdown))
@@ -424,18 +497,47 @@ class PdfWrapper:
             PdfWrapper: The `PdfWrapper` object, allowing for method chaining.
         """
 
-        for key, value in data.items():
-            if key in self.widgets:
-                try:
-                    self.widgets[key].value = value
-                except Exception as e:
-                    warn(
-                        f"Failed to set value for widget '{key}': {type(e).__name__}: {e}. "
-                        "This widget will be skipped.",
-                        UserWarning,
-                        stacklevel=2,
-                    )
-                    continue
+        # deferred fields must exist before key matching; the internal read()
+        # below would flush them anyway, but only after their values had
+        # been dismissed as unknown keys
+        self._flush_pending_fields()
+
+        known_keys = data.keys() & self.widgets.keys()
+
+        unknown_keys = data.keys() - known_keys
+        if unknown_keys:
+            warn(
+                f"Unknown widget keys skipped during fill: {', '.join(sorted(unknown_keys))}.",
+                UserWarning,
+                stacklevel=2,
+            )
+
+        if len(known_keys) >= BULK_FILL_MIN_WIDGETS:
+            # large batches are dominated by plain strings on plain text
+            # widgets, whose value setter is a bare attribute assignment;
+            # writing `_value` directly skips two passes through the
+            # hook-dispatching `__setattr__` per widget, the same bypass
+            # `template.populate_widget_attributes` uses
+            slow_keys = []
+            for key in known_keys:
+                widget = self.widgets[key]
+                if type(widget) is Text and isinstance(data[key], str):
+                    widget.__dict__["_value"] = data[key]
+                else:
+                    slow_keys.append(key)
+        else:
+            slow_keys = known_keys
+
+        for key in slow_keys:
+            try:
+                self.widgets[key].value = data[key]
+            except Exception as e:  # noqa: PERF203
+                warn(
+                    f"Failed to set value for widget '{key}': {type(e).__name__}: {e}. "
+                    "This widget will be skipped.",
+                    UserWarning,
+                    stacklevel=2,
+                )
 
         filled_stream, image_drawn_stream = fill(
             self.read(),
@@ -480,6 +582,16 @@ class PdfWrapper:
             PdfWrapper: The `PdfWrapper` object, allowing for method chaining.
         """
 
+        # group fields by page so each page's annotations are emitted
+        # contiguously downstream; the sort is stable, preserving the
+        # caller's ordering within a page
+        fields = sorted(fields, key=attrgetter("page_number"))
+
+        # fast path: a single-type batch needs no per-field type bucketing
+        # and can be drawn in one pass
+        if fields and len({type(each) for each in fields}) == 1:
+            return self._bulk_create_fields(fields)
+
         needs_separate_creation = [CheckBoxField, SignatureField, ImageField]
         needs_separate_creation_dict = defaultdict(list)
         general_creation = []
@@ -536,6 +648,26 @@ class PdfWrapper:
                 )
             )
 
+        return self._draw_bulk_widgets(widget_class, widgets)
+
+    def _draw_bulk_widgets(self, widget_class: type, widgets: list) -> PdfWrapper:
+        """
+        Internal method to draw a list of already constructed `Widget` objects onto the PDF.
+
+        This method performs the shared tail of every bulk creation path: it
+        renders all widgets as watermarks in one pass, copies the resulting
+        annotations back onto the PDF, rebuilds the widget dictionary, and
+        applies any pending hook parameters.
+
+        Args:
+            widget_class (type): The `Widget` subclass the widgets belong to,
+                used to dispatch the bulk watermark rendering.
+            widgets (list): A list of constructed `Widget` objects to draw.
+
+        Returns:
+            PdfWrapper: The `PdfWrapper` object, allowing for method chaining.
+        """
+
         watermarks = getattr(widget_class, "bulk_watermarks")(widgets, self.read())
         self._stream = copy_watermark_widgets(
             self.read(),
@@ -552,9 +684,78 @@ class PdfWrapper:
 
         return self
 
+    def bulk_create_text_fields(
+        self,
+        names: Sequence[str],
+        xs: Sequence[float],
+        ys: Sequence[float],
+        widths: Union[Sequence[float], None] = None,
+        heights: Union[Sequence[float], None] = None,
+        font_sizes: Union[Sequence[float], None] = None,
+        max_lengths: Union[Sequence[int], None] = None,
+        page_number: int = 1,
+    ) -> PdfWrapper:
+        """
+        Creates multiple text fields from parallel sequences of attributes.
+
+        This is a specialized alternative to `bulk_create_fields` for large
+        homogeneous batches of text fields. Instead of materializing one
+        `TextField` object per field, it accepts one sequence per attribute
+        (a struct-of-arrays layout) and constructs the underlying widgets
+        directly, avoiding the per-field dataclass and dictionary overhead.
+
+        Args:
+            names (Sequence[str]): The names of the text fields.
+            xs (Sequence[float]): The x coordinates of the text fields.
+            ys (Sequence[float]): The y coordinates of the text fields.
+            widths (Union[Sequence[float], None]): The widths of the text fields,
+                or None to use the default width for every field.
+            heights (Union[Sequence[float], None]): The heights of the text fields,
+                or None to use the default height for every field.
+            font_sizes (Union[Sequence[float], None]): The font sizes of the text
+                fields, or None to use the default font size for every field.
+            max_lengths (Union[Sequence[int], None]): The maximum lengths of the
+                text fields, or None for no maximum length.
+            page_number (int): The page number to create the text fields on (default: 1).
+
+        Returns:
+            PdfWrapper: The `PdfWrapper` object, allowing for method chaining.
+        """
+
+        if not names:
+            return self
+
+        none_column = [None] * len(names)
+        widgets = []
+        for name, x, y, width, height, font_size, max_length in zip(
+            names,
+            xs,
+            ys,
+            widths if widths is not None else none_column,
+            heights if heights is not None else none_column,
+            font_sizes if font_sizes is not None else none_column,
+            max_lengths if max_lengths is not None else none_column,
+            strict=True,
+        ):
+            kwargs = {}
+            if width is not None:
+                kwargs["width"] = width
+            if height is not None:
+                kwargs["height"] = height
+            if font_size is not None:
+                kwargs["font_size"] = font_size
+            if max_length is not None:
+                kwargs["max_length"] = max_length
+            widgets.append(
+                TextWidget(name=name, page_number=page_number, x=x, y=y, **kwargs)
+            )
+
+        return self._draw_bulk_widgets(TextWidget, widgets)
+
     def create_field(
         self,
         field: FieldTypes,
+        defer: bool = False,
     ) -> PdfWrapper:
         """
         Creates a new form field (widget) on the PDF using a `FieldTypes` object.
@@ -566,11 +767,21 @@ class PdfWrapper:
             field (FieldTypes): An object representing the field to create.
                 This object encapsulates all necessary properties like name,
                 page number, coordinates, and type of the field.
+            defer (bool): Whether to defer the creation. If True, the field is
+                added to a queue and all queued fields are created in a single
+                bulk operation the next time the PDF content is read. This
+                avoids one full PDF rebuild per field when creating many
+                fields one at a time. Deferred fields do not appear in
+                `widgets` until then. Defaults to False.
 
         Returns:
             PdfWrapper: The `PdfWrapper` object, allowing for method chaining.
         """
 
+        if defer:
+            self._pending_fields.append(field)
+            return self
+
         field_dict = asdict(field)
         widget_type = field_dict.pop("_field_type")
         name = field_dict.pop("name")
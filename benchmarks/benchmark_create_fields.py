@@ -4,47 +4,55 @@
 Simple benchmark comparing create_field vs create_fields performance.
 """
 
+import sys
 import time
-from io import BytesIO
+from pathlib import Path
 
-from pypdf import PdfWriter
 from PyPDFForm import PdfWrapper
 from PyPDFForm.widgets.text import TextField
 from PyPDFForm.widgets.checkbox import CheckBoxField
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tests"))
+
+from _blank_pdf import blank_pdf  # type: ignore # noqa: E402
+
 
 def create_blank_pdf(num_pages=1):
-    """Create a blank PDF with the specified number of pages."""
-    pdf_writer = PdfWriter()
-    for _ in range(num_pages):
-        pdf_writer.add_blank_page(width=612, height=792)  # Letter size
+    """Create a blank PDF with the specified number of pages.
 
-    output = BytesIO()
-    pdf_writer.write(output)
-    output.seek(0)
-    return output.read()
+    Delegates to the raw-bytes builder shared with the test suite, which
+    memoizes on `num_pages`; callers treat the returned bytes as immutable.
+    """
+    return blank_pdf(num_pages)
 
 
-def benchmark_single(n_fields):
+def benchmark_single(n_fields, blank_pdf):
     """Benchmark using create_widget for each field individually."""
-    blank_pdf = create_blank_pdf(1)
     obj = PdfWrapper(blank_pdf)
 
     translucent_bg = (0.95, 0.95, 0.95)
     border_width = 1
 
-    start_time = time.perf_counter()
+    # precompute field geometry so the timed loop measures the API cost,
+    # not the coordinate arithmetic
+    xs = [10 + (i % 5) * 100 for i in range(n_fields)]
+    ys = [10 + (i // 5) * 50 for i in range(n_fields)]
+    names = [
+        f"checkbox_{i}" if i % 4 == 0 else f"field_{i}" for i in range(n_fields)
+    ]
+
+    start_time = time.perf_counter_ns()
 
     for i in range(n_fields):
         is_checkbox = (i % 4 == 0)
 
         if is_checkbox:
-            obj = obj.create_widget(
+            obj.create_widget(
                 widget_type="checkbox",
-                name=f"checkbox_{i}",
+                name=names[i],
                 page_number=1,
-                x=10 + (i % 5) * 100,
-                y=10 + (i // 5) * 50,
+                x=xs[i],
+                y=ys[i],
                 size=15,
                 bg_color=translucent_bg,
                 border_width=border_width,
@@ -56,12 +64,12 @@ def benchmark_single(n_fields):
             font_size = min(12, height * 0.6)
             max_length = int(width / (font_size * 0.5))
 
-            obj = obj.create_widget(
+            obj.create_widget(
                 widget_type="text",
-                name=f"field_{i}",
+                name=names[i],
                 page_number=1,
-                x=10 + (i % 5) * 100,
-                y=10 + (i // 5) * 50,
+                x=xs[i],
+                y=ys[i],
                 width=max(5, width),
                 height=max(5, height),
                 bg_color=translucent_bg,
@@ -72,25 +80,31 @@ def benchmark_single(n_fields):
                 suppress_deprecation_notice=True,
             )
 
-    elapsed = time.perf_counter() - start_time
+    elapsed = time.perf_counter_ns() - start_time
     return elapsed
 
 
-def benchmark_batch(n_fields):
+def benchmark_batch(n_fields, blank_pdf):
     """Benchmark using bulk_create_fields for batch creation."""
-    blank_pdf = create_blank_pdf(1)
     obj = PdfWrapper(blank_pdf)
 
+    # precompute field geometry outside the construction loop
+    xs = [10 + (i % 5) * 100 for i in range(n_fields)]
+    ys = [10 + (i // 5) * 50 for i in range(n_fields)]
+    names = [
+        f"checkbox_{i}" if i % 4 == 0 else f"field_{i}" for i in range(n_fields)
+    ]
+
     fields = []
     for i in range(n_fields):
         is_checkbox = (i % 4 == 0)
 
         if is_checkbox:
             field = CheckBoxField(
-                name=f"checkbox_{i}",
+                name=names[i],
                 page_number=1,
-                x=10 + (i % 5) * 100,
-                y=10 + (i // 5) * 50,
+                x=xs[i],
+                y=ys[i],
                 size=15,
             )
         else:
@@ -100,10 +114,10 @@ def benchmark_batch(n_fields):
             max_length = int(width / (font_size * 0.5))
 
             field = TextField(
-                name=f"field_{i}",
+                name=names[i],
                 page_number=1,
-                x=10 + (i % 5) * 100,
-                y=10 + (i // 5) * 50,
+                x=xs[i],
+                y=ys[i],
                 width=width,
                 height=height,
                 font_size=font_size,
@@ -112,13 +126,46 @@ def benchmark_batch(n_fields):
 
         fields.append(field)
 
-    start_time = time.perf_counter()
+    start_time = time.perf_counter_ns()
     obj.bulk_create_fields(fields)
-    elapsed = time.perf_counter() - start_time
+    elapsed = time.perf_counter_ns() - start_time
 
     return elapsed
 
 
+WARMUP_RUNS = 3
+TIMING_REPEATS = 7
+
+
+def sampling_plan(n_fields):
+    """Return the (warmups, repeats) to use for a given field count.
+
+    Small field counts are noise-dominated and cheap to resample, so they
+    get the full warm-up and repeat budget. Large counts are stable but
+    expensive — the single-field path re-parses the document per field —
+    so the sampling scales down to keep total runtime bounded.
+    """
+    if n_fields >= 100:
+        return 1, 2
+    if n_fields >= 50:
+        return 2, 3
+    return WARMUP_RUNS, TIMING_REPEATS
+
+
+def run_benchmark(benchmark, n_fields, blank_pdf):
+    """Run a benchmark with warm-up passes and return the best-of-N time in ns.
+
+    A single wall-clock sample is noise-dominated for small field counts, so
+    each benchmark is run a few times untimed to reach steady state and then
+    sampled repeatedly, reporting the minimum.
+    """
+    warmups, repeats = sampling_plan(n_fields)
+    for _ in range(warmups):
+        benchmark(n_fields, blank_pdf)
+
+    return min(benchmark(n_fields, blank_pdf) for _ in range(repeats))
+
+
 def main():
     print("=" * 80)
     print("PyPDFForm Performance Benchmark: create_widget vs bulk_create_fields")
@@ -127,19 +174,36 @@ def main():
 
     test_cases = [1, 10, 50, 100]
 
-    print(f"{'Fields':<10} {'Single (s)':<15} {'Batch (s)':<15} {'Speedup':<10}")
+    # synthesized once, outside every timed region
+    blank_pdf = create_blank_pdf(1)
+
+    # warm pypdf/reportlab lazy imports, codec setup, and CPython inline
+    # caches before anything is timed, so the small-n numbers are not
+    # dominated by one-off initialization cost
+    PdfWrapper(blank_pdf).create_widget(
+        widget_type="text",
+        name="_warm",
+        page_number=1,
+        x=0,
+        y=0,
+        width=10,
+        height=10,
+        suppress_deprecation_notice=True,
+    )
+
+    print(f"{'Fields':<10} {'Single (ns)':<15} {'Batch (ns)':<15} {'Speedup':<10}")
     print("-" * 80)
 
     for n in test_cases:
         print(f"{n:<10}", end=" ", flush=True)
 
         # Benchmark single method
-        single_time = benchmark_single(n)
-        print(f"{single_time:<15.4f}", end=" ", flush=True)
+        single_time = run_benchmark(benchmark_single, n, blank_pdf)
+        print(f"{single_time:<15d}", end=" ", flush=True)
 
         # Benchmark batch method
-        batch_time = benchmark_batch(n)
-        print(f"{batch_time:<15.4f}", end=" ", flush=True)
+        batch_time = run_benchmark(benchmark_batch, n, blank_pdf)
+        print(f"{batch_time:<15d}", end=" ", flush=True)
 
         # Calculate speedup
         speedup = single_time / batch_time if batch_time > 0 else 0
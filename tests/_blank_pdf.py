@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+Raw-bytes blank PDF builder for tests.
+
+Several batch tests only need "a blank Letter-size PDF with N pages" as
+input, and building one through PdfWriter pays pypdf's pure-Python
+serialization on every call. The document structure is trivial, so this
+module formats the bytes directly: a catalog, a page tree, N identical
+page objects, and a hand-built xref table.
+"""
+
+from functools import lru_cache
+
+PDF_HEADER = b"%PDF-1.3\n"
+
+BLANK_PAGE_TEMPLATE = (
+    "{num} 0 obj\n"
+    "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+    "/Resources << >> >>\n"
+    "endobj\n"
+)
+
+
+@lru_cache(maxsize=8)
+def blank_pdf(num_pages: int = 1) -> bytes:
+    """Builds a blank Letter-size PDF with the given number of pages.
+
+    The output is deterministic, so results are memoized; callers treat
+    the returned bytes as immutable.
+    """
+    page_numbers = range(3, 3 + num_pages)
+    kids = " ".join(f"{num} 0 R" for num in page_numbers)
+
+    objects = [
+        b"1 0 obj\n<< /Type /Catalog /Pages 2 0 R >>\nendobj\n",
+        (
+            f"2 0 obj\n<< /Type /Pages /Kids [{kids}] "
+            f"/Count {num_pages} >>\nendobj\n"
+        ).encode(),
+    ]
+    objects.extend(
+        BLANK_PAGE_TEMPLATE.format(num=num).encode() for num in page_numbers
+    )
+
+    result = bytearray(PDF_HEADER)
+    offsets = []
+    for obj in objects:
+        offsets.append(len(result))
+        result += obj
+
+    xref_offset = len(result)
+    result += f"xref\n0 {len(objects) + 1}\n".encode()
+    result += b"0000000000 65535 f \n"
+    for offset in offsets:
+        result += f"{offset:010d} 00000 n \n".encode()
+    result += (
+        f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n"
+        f"startxref\n{xref_offset}\n%%EOF\n"
+    ).encode()
+
+    return bytes(result)
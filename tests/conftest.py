@@ -22,7 +22,7 @@ def _generate_new_pdf_samples(request):
             f.write(request.config.results["stream"])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def pdf_samples():
     return os.path.join(os.path.dirname(__file__), "..", "pdf_samples")
 
@@ -32,8 +32,10 @@ def static_pdfs():
     return os.path.join(os.path.dirname(__file__), "..", "docs", "pdfs")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def template_stream(pdf_samples):
+    # the returned bytes are immutable, so one read can be shared by
+    # every test in a module
     with open(os.path.join(pdf_samples, "sample_template.pdf"), "rb+") as f:
         return f.read()
 
@@ -182,7 +184,7 @@ def sample_template_with_paragraph_auto_font(pdf_samples):
         return f.read()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_template_with_dropdown(pdf_samples):
     with open(
         os.path.join(pdf_samples, "dropdown", "sample_template_with_dropdown.pdf"),
@@ -477,6 +477,7 @@ def test_merge_sejda_pdf_forms(issue_pdf_directory):
         page_data = data[i]
         for widget in page.annotations or []:
             key = get_widget_key(widget, use_full_widget_name=False)
+            assert key is not None
             for k, v in page_data.items():
                 if key.startswith(k):
                     assert widget[Parent][V] == v
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for input adaptation to byte streams.
+"""
+
+from io import BytesIO
+
+from PyPDFForm import PdfWrapper
+from PyPDFForm.adapter import fp_or_f_obj_or_stream_to_stream
+
+
+def test_bytes_input_passes_through_without_copy(template_stream):
+    """Test that bytes input is returned as the same object."""
+    assert fp_or_f_obj_or_stream_to_stream(template_stream) is template_stream
+
+
+def test_bytearray_and_memoryview_input(template_stream):
+    """Test that mutable bytes-like inputs are adapted to bytes."""
+    assert fp_or_f_obj_or_stream_to_stream(bytearray(template_stream)) == template_stream
+    assert fp_or_f_obj_or_stream_to_stream(memoryview(template_stream)) == template_stream
+
+
+def test_wrapper_accepts_bytes_like_template(template_stream):
+    """Test that PdfWrapper can be constructed from bytes-like input."""
+    obj = PdfWrapper(memoryview(template_stream))
+
+    assert set(obj.widgets.keys()) == set(PdfWrapper(template_stream).widgets.keys())
+
+
+def test_file_object_input(template_stream):
+    """Test that file-like objects are read into bytes."""
+    assert fp_or_f_obj_or_stream_to_stream(BytesIO(template_stream)) == template_stream
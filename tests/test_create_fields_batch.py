@@ -7,27 +7,24 @@ in a single operation, and that the resulting widgets behave identically
 to those created individually with create_field.
 """
 
-from io import BytesIO
-
 import pytest
-from pypdf import PdfWriter
 
 from PyPDFForm import PdfWrapper
+from PyPDFForm.template import scan_widget_names
 from PyPDFForm.widgets.checkbox import CheckBoxField
 from PyPDFForm.widgets.dropdown import DropdownField
 from PyPDFForm.widgets.text import TextField
 
+from _blank_pdf import blank_pdf
+
 
 def create_blank_pdf(num_pages=1):
-    """Create a blank PDF with the specified number of pages."""
-    pdf_writer = PdfWriter()
-    for _ in range(num_pages):
-        pdf_writer.add_blank_page(width=612, height=792)  # Letter size
+    """Create a blank PDF with the specified number of pages.
 
-    output = BytesIO()
-    pdf_writer.write(output)
-    output.seek(0)
-    return output.read()
+    Delegates to the raw-bytes builder, which memoizes on `num_pages`;
+    the returned bytes are treated as immutable by every caller.
+    """
+    return blank_pdf(num_pages)
 
 
 def test_create_fields_single_text_field():
@@ -192,15 +189,15 @@ def test_create_fields_equivalence_with_create_field():
 
     This verifies functional equivalence between the batch and single methods.
     """
-    blank_pdf = create_blank_pdf(1)
+    base = PdfWrapper(create_blank_pdf(1))
 
     # Create using individual create_field calls
-    obj1 = PdfWrapper(blank_pdf)
+    obj1 = base.clone()
     for i in range(5):
         obj1.create_field(TextField(name=f"field{i}", page_number=1, x=10 + i * 50, y=10))
 
     # Create using batch bulk_create_fields
-    obj2 = PdfWrapper(blank_pdf)
+    obj2 = base.clone()
     fields = [
         TextField(name=f"field{i}", page_number=1, x=10 + i * 50, y=10) for i in range(5)
     ]
@@ -215,6 +212,24 @@ def test_create_fields_equivalence_with_create_field():
         assert obj1.widgets[key].name == obj2.widgets[key].name
 
 
+def test_clone_is_independent():
+    """Test that a cloned wrapper shares content but not widget state."""
+    obj = PdfWrapper(create_blank_pdf(1))
+    obj.bulk_create_fields(
+        [TextField(name="field1", page_number=1, x=10, y=10)]
+    )
+
+    cloned = obj.clone()
+
+    assert cloned is not obj
+    assert cloned.read() == obj.read()
+    assert set(cloned.widgets.keys()) == set(obj.widgets.keys())
+
+    # mutating the clone's widgets must not leak back into the original
+    cloned.fill({"field1": "clone value"})
+    assert obj.widgets["field1"].value != "clone value"
+
+
 def test_create_fields_with_dropdown_options():
     """Test creating dropdown fields with options."""
     blank_pdf = create_blank_pdf(1)
@@ -262,6 +277,260 @@ def test_create_fields_large_batch():
         assert f"field{i}" in obj.widgets
 
 
+def test_bulk_create_text_fields_parallel_sequences():
+    """Test creating text fields from parallel attribute sequences."""
+    blank_pdf = create_blank_pdf(1)
+    obj = PdfWrapper(blank_pdf)
+
+    names = [f"field{i}" for i in range(5)]
+    xs = [10 + i * 50 for i in range(5)]
+    ys = [10] * 5
+
+    obj.bulk_create_text_fields(
+        names, xs, ys, max_lengths=[20, 20, 20, 20, 20]
+    )
+
+    assert len(obj.widgets) == 5
+    for name in names:
+        assert name in obj.widgets
+    assert obj.widgets["field0"].max_length == 20
+
+
+def test_bulk_create_text_fields_equivalence_with_bulk_create_fields():
+    """Test that the struct-of-arrays path matches the list-of-fields path."""
+    blank_pdf = create_blank_pdf(1)
+
+    obj1 = PdfWrapper(blank_pdf)
+    fields = [
+        TextField(name=f"field{i}", page_number=1, x=10 + i * 50, y=10, width=100)
+        for i in range(5)
+    ]
+    obj1.bulk_create_fields(fields)
+
+    obj2 = PdfWrapper(blank_pdf)
+    obj2.bulk_create_text_fields(
+        names=[f"field{i}" for i in range(5)],
+        xs=[10 + i * 50 for i in range(5)],
+        ys=[10] * 5,
+        widths=[100] * 5,
+    )
+
+    assert set(obj1.widgets.keys()) == set(obj2.widgets.keys())
+    for key in obj1.widgets:
+        assert obj1.widgets[key].name == obj2.widgets[key].name
+
+
+def test_bulk_create_text_fields_heights_and_font_sizes():
+    """Test that per-field heights and font sizes are applied."""
+    blank_pdf = create_blank_pdf(1)
+
+    obj1 = PdfWrapper(blank_pdf)
+    obj1.bulk_create_fields(
+        [
+            TextField(name="field0", page_number=1, x=10, y=10, height=30, font_size=8),
+            TextField(name="field1", page_number=1, x=120, y=10, height=40, font_size=12),
+        ]
+    )
+
+    obj2 = PdfWrapper(blank_pdf)
+    obj2.bulk_create_text_fields(
+        names=["field0", "field1"],
+        xs=[10, 120],
+        ys=[10, 10],
+        heights=[30, 40],
+        font_sizes=[8, 12],
+    )
+
+    assert len(obj2.widgets) == 2
+    assert obj2.read() == obj1.read()
+
+
+def test_bulk_create_text_fields_mismatched_lengths():
+    """Test that attribute sequences of different lengths are rejected."""
+    blank_pdf = create_blank_pdf(1)
+    obj = PdfWrapper(blank_pdf)
+
+    with pytest.raises(ValueError, match="argument 2 is shorter"):
+        obj.bulk_create_text_fields(["field0", "field1"], [10], [10, 10])
+
+
+def test_bulk_create_text_fields_empty():
+    """Test bulk_create_text_fields with empty sequences."""
+    blank_pdf = create_blank_pdf(1)
+    obj = PdfWrapper(blank_pdf)
+
+    result = obj.bulk_create_text_fields([], [], [])
+
+    assert result is obj
+    assert len(obj.widgets) == 0
+
+
+def test_fill_large_string_batch():
+    """Test filling a batch of text fields large enough for the fast path."""
+    blank_pdf = create_blank_pdf(1)
+    obj = PdfWrapper(blank_pdf)
+
+    fields = [
+        TextField(
+            name=f"field{i}",
+            page_number=1,
+            x=10 + (i % 10) * 50,
+            y=10 + (i // 10) * 30,
+        )
+        for i in range(40)
+    ]
+    obj.bulk_create_fields(fields)
+
+    obj.fill({f"field{i}": f"value{i}" for i in range(40)})
+
+    for i in range(40):
+        assert obj.widgets[f"field{i}"].value == f"value{i}"
+    assert obj.read().startswith(b"%PDF")
+
+
+def test_fill_large_mixed_batch():
+    """Test that a large fill still routes non-string values correctly."""
+    blank_pdf = create_blank_pdf(1)
+    obj = PdfWrapper(blank_pdf)
+
+    fields = [
+        TextField(
+            name=f"field{i}",
+            page_number=1,
+            x=10 + (i % 10) * 50,
+            y=10 + (i // 10) * 30,
+        )
+        for i in range(35)
+    ] + [
+        CheckBoxField(name=f"check{i}", page_number=1, x=10 + i * 30, y=200)
+        for i in range(5)
+    ]
+    obj.bulk_create_fields(fields)
+
+    data = {
+        **{f"field{i}": f"value{i}" for i in range(35)},
+        **{f"check{i}": True for i in range(5)},
+    }
+    obj.fill(data)
+
+    for i in range(35):
+        assert obj.widgets[f"field{i}"].value == f"value{i}"
+    for i in range(5):
+        assert obj.widgets[f"check{i}"].value is True
+
+
+def test_clone_preserves_deferred_fields():
+    """Test that clone carries the deferred field queue along."""
+    blank_pdf = create_blank_pdf(1)
+    obj = PdfWrapper(blank_pdf)
+
+    for i in range(3):
+        obj.create_field(
+            TextField(name=f"field{i}", page_number=1, x=10 + i * 50, y=10),
+            defer=True,
+        )
+
+    cloned = obj.clone()
+
+    # still queued on both sides; a read flushes each independently
+    assert len(cloned.widgets) == 0
+    cloned.read()
+    assert len(cloned.widgets) == 3
+    assert len(obj.widgets) == 0
+
+    obj.read()
+    assert len(obj.widgets) == 3
+
+
+def test_create_field_deferred_flushes_on_read():
+    """Test that deferred create_field calls are flushed in one pass on read."""
+    blank_pdf = create_blank_pdf(1)
+    obj = PdfWrapper(blank_pdf)
+
+    for i in range(5):
+        obj.create_field(
+            TextField(name=f"field{i}", page_number=1, x=10 + i * 50, y=10),
+            defer=True,
+        )
+
+    # deferred fields are not materialized until the PDF is read
+    assert len(obj.widgets) == 0
+
+    pdf_bytes = obj.read()
+    assert pdf_bytes.startswith(b"%PDF")
+    assert len(obj.widgets) == 5
+    for i in range(5):
+        assert f"field{i}" in obj.widgets
+
+
+def test_clone_preserves_deferred_key_updates():
+    """Test that clone carries queued widget key renames along."""
+    blank_pdf = create_blank_pdf(1)
+    obj = PdfWrapper(blank_pdf)
+    obj.bulk_create_fields(
+        [TextField(name="field1", page_number=1, x=10, y=10)]
+    )
+
+    obj.update_widget_key("field1", "renamed", defer=True)
+    cloned = obj.clone()
+
+    cloned.commit_widget_key_updates()
+    assert "renamed" in cloned.widgets
+
+    # the original's queue is untouched until it commits on its own
+    assert "field1" in obj.widgets
+    obj.commit_widget_key_updates()
+    assert "renamed" in obj.widgets
+
+
+def test_fill_after_deferred_create(recwarn):
+    """Test that filling a still-deferred field sets its value."""
+    blank_pdf = create_blank_pdf(1)
+    obj = PdfWrapper(blank_pdf)
+
+    obj.create_field(
+        TextField(name="field1", page_number=1, x=10, y=10), defer=True
+    )
+    obj.fill({"field1": "hello"})
+
+    # the field is created on the spot rather than skipped as unknown
+    assert not any("Unknown widget keys" in str(w.message) for w in recwarn.list)
+    assert obj.widgets["field1"].value == "hello"
+    assert obj.read().startswith(b"%PDF")
+
+
+def test_schema_and_data_include_deferred_fields():
+    """Test that schema and data materialize deferred fields."""
+    blank_pdf = create_blank_pdf(1)
+    obj = PdfWrapper(blank_pdf)
+
+    obj.create_field(
+        TextField(name="field1", page_number=1, x=10, y=10), defer=True
+    )
+
+    assert "field1" in obj.schema["properties"]
+    assert "field1" in obj.data
+
+
+def test_create_field_deferred_equivalence():
+    """Test that deferred creation matches eager create_field results."""
+    blank_pdf = create_blank_pdf(1)
+
+    obj1 = PdfWrapper(blank_pdf)
+    for i in range(3):
+        obj1.create_field(TextField(name=f"field{i}", page_number=1, x=10 + i * 50, y=10))
+
+    obj2 = PdfWrapper(blank_pdf)
+    for i in range(3):
+        obj2.create_field(
+            TextField(name=f"field{i}", page_number=1, x=10 + i * 50, y=10),
+            defer=True,
+        )
+    obj2.read()
+
+    assert set(obj1.widgets.keys()) == set(obj2.widgets.keys())
+
+
 def test_create_fields_read_output():
     """Test that the PDF output is valid after bulk_create_fields."""
     blank_pdf = create_blank_pdf(1)
@@ -279,3 +548,9 @@ def test_create_fields_read_output():
     assert pdf_bytes is not None
     assert len(pdf_bytes) > 0
     assert pdf_bytes.startswith(b"%PDF")
+
+    # the created fields exist in the output; the raw scan avoids paying
+    # a full re-parse just for this existence check
+    names = scan_widget_names(pdf_bytes)
+    assert "field1" in names
+    assert "field2" in names
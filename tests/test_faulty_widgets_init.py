@@ -8,13 +8,12 @@ warn the user, and continue processing.
 """
 
 import warnings
-from unittest.mock import patch
 
 from PyPDFForm import PdfWrapper
-from PyPDFForm.template import get_dropdown_choices
+from PyPDFForm.template import construct_widget, get_dropdown_choices
 
 
-def test_faulty_widget_skipped_and_continues(template_stream):
+def test_faulty_widget_skipped_and_continues(template_stream, monkeypatch):
     """Test that a faulty widget is skipped and processing continues."""
     with warnings.catch_warnings(record=True) as w:
         warnings.simplefilter("always")
@@ -29,19 +28,19 @@ def test_faulty_widget_skipped_and_continues(template_stream):
                 raise ValueError("Simulated widget processing error")
             return f"widget_{call_count[0]}"
 
-        with patch('PyPDFForm.template.get_widget_key', side_effect=mock_get_widget_key):
-            obj = PdfWrapper(template_stream)
+        monkeypatch.setattr("PyPDFForm.template.get_widget_key", mock_get_widget_key)
+        obj = PdfWrapper(template_stream)
 
-            # PdfWrapper should still be created successfully
-            assert obj is not None
+        # PdfWrapper should still be created successfully
+        assert obj is not None
 
-            # Should have issued at least one warning
-            assert len(w) > 0
-            warning_messages = [str(warning.message) for warning in w]
-            assert any("Failed to process widget" in msg for msg in warning_messages)
+        # Should have issued at least one warning
+        assert len(w) > 0
+        warning_messages = [str(warning.message) for warning in w]
+        assert any("Failed to process widget" in msg for msg in warning_messages)
 
 
-def test_exception_during_widget_construction(template_stream):
+def test_exception_during_widget_construction(template_stream, monkeypatch):
     """Test that exceptions during widget construction are caught."""
     with warnings.catch_warnings(record=True) as w:
         warnings.simplefilter("always")
@@ -50,34 +49,36 @@ def test_exception_during_widget_construction(template_stream):
         def mock_construct_widget(widget, key):
             raise RuntimeError("Widget construction failed")
 
-        with patch('PyPDFForm.template.construct_widget', side_effect=mock_construct_widget):
-            obj = PdfWrapper(template_stream)
+        monkeypatch.setattr("PyPDFForm.template.construct_widget", mock_construct_widget)
+        obj = PdfWrapper(template_stream)
 
-            # Should not crash
-            assert obj is not None
-            # Should have warnings
-            assert len(w) > 0
+        # Should not crash
+        assert obj is not None
+        # Should have warnings
+        assert len(w) > 0
 
 
-def test_dropdown_with_none_choices_warns(sample_template_with_dropdown):
+def test_dropdown_with_none_choices_warns(sample_template_with_dropdown, monkeypatch):
     """Test that dropdowns with None choices issue a warning."""
     with warnings.catch_warnings(record=True) as w:
         warnings.simplefilter("always")
 
         # Mock get_dropdown_choices to return None
-        with patch('PyPDFForm.template.get_dropdown_choices', return_value=None):
-            obj = PdfWrapper(sample_template_with_dropdown)
+        monkeypatch.setattr(
+            "PyPDFForm.template.get_dropdown_choices", lambda widget: None
+        )
+        obj = PdfWrapper(sample_template_with_dropdown)
 
-            # Should still create wrapper
-            assert obj is not None
+        # Should still create wrapper
+        assert obj is not None
 
-            # Should warn about missing choices
-            assert len(w) > 0
-            warning_messages = [str(warning.message) for warning in w]
-            assert any("has no choices defined" in msg for msg in warning_messages)
+        # Should warn about missing choices
+        assert len(w) > 0
+        warning_messages = [str(warning.message) for warning in w]
+        assert any("has no choices defined" in msg for msg in warning_messages)
 
 
-def test_multiple_faulty_widgets_all_skipped(template_stream):
+def test_multiple_faulty_widgets_all_skipped(template_stream, monkeypatch):
     """Test that multiple faulty widgets are all skipped."""
     with warnings.catch_warnings(record=True) as w:
         warnings.simplefilter("always")
@@ -86,31 +87,42 @@ def test_multiple_faulty_widgets_all_skipped(template_stream):
         def mock_get_widget_key(widget, use_full_name):
             raise ValueError("All widgets are faulty")
 
-        with patch('PyPDFForm.template.get_widget_key', side_effect=mock_get_widget_key):
-            obj = PdfWrapper(template_stream)
+        monkeypatch.setattr("PyPDFForm.template.get_widget_key", mock_get_widget_key)
+        obj = PdfWrapper(template_stream)
 
-            # Should still create wrapper (with no widgets)
-            assert obj is not None
-            assert len(obj.widgets) == 0
+        # Should still create wrapper (with no widgets)
+        assert obj is not None
+        assert len(obj.widgets) == 0
 
-            # Should have warnings for each failed widget
-            assert len(w) > 0
+        # Should have warnings for each failed widget
+        assert len(w) > 0
 
 
-def test_error_types_reported_correctly(sample_template_with_dropdown):
+def test_error_types_reported_correctly(sample_template_with_dropdown, monkeypatch):
     """Test that different error types are reported in warnings."""
     with warnings.catch_warnings(record=True) as w:
         warnings.simplefilter("always")
 
         # Simulate a TypeError
-        with patch('PyPDFForm.template.get_dropdown_choices', side_effect=TypeError("test error")):
-            obj = PdfWrapper(sample_template_with_dropdown)
+        def mock_get_dropdown_choices(widget):
+            raise TypeError("test error")
 
-            assert obj is not None
-            warning_messages = [str(warning.message) for warning in w]
-            # Should mention the error type in the warning
-            assert any("TypeError" in msg for msg in warning_messages)
-            assert any("test error" in msg for msg in warning_messages)
+        monkeypatch.setattr(
+            "PyPDFForm.template.get_dropdown_choices", mock_get_dropdown_choices
+        )
+        obj = PdfWrapper(sample_template_with_dropdown)
+
+        assert obj is not None
+        warning_messages = [str(warning.message) for warning in w]
+        # Should mention the error type in the warning
+        assert any("TypeError" in msg for msg in warning_messages)
+        assert any("test error" in msg for msg in warning_messages)
+
+
+def test_construct_widget_unrecognized_type_returns_none():
+    """Test that an annotation matching no widget type pattern yields None."""
+    result = construct_widget({}, "unrecognized")
+    assert result is None
 
 
 def test_get_dropdown_choices_none_handling():
@@ -120,7 +132,7 @@ def test_get_dropdown_choices_none_handling():
     assert result is None
 
 
-def test_dropdown_nonetype_not_iterable_error(sample_template_with_dropdown):
+def test_dropdown_nonetype_not_iterable_error(sample_template_with_dropdown, monkeypatch):
     """
     Test that dropdown widgets with None choices don't crash with:
     TypeError: 'NoneType' object is not iterable
@@ -140,17 +152,19 @@ def test_dropdown_nonetype_not_iterable_error(sample_template_with_dropdown):
             # For other patterns, use a safe default
             return default
 
-        with patch('PyPDFForm.template.extract_widget_property', side_effect=mock_extract_widget_property):
-            # This should NOT raise TypeError anymore
-            obj = PdfWrapper(sample_template_with_dropdown, adobe_mode=True)
+        monkeypatch.setattr(
+            "PyPDFForm.template.extract_widget_property", mock_extract_widget_property
+        )
+        # This should NOT raise TypeError anymore
+        obj = PdfWrapper(sample_template_with_dropdown, adobe_mode=True)
 
-            # Should successfully create wrapper
-            assert obj is not None
+        # Should successfully create wrapper
+        assert obj is not None
 
-            # Should have issued warnings about missing choices
-            assert len(w) > 0
-            warning_messages = [str(warning.message) for warning in w]
-            assert any("has no choices defined" in msg for msg in warning_messages)
+        # Should have issued warnings about missing choices
+        assert len(w) > 0
+        warning_messages = [str(warning.message) for warning in w]
+        assert any("has no choices defined" in msg for msg in warning_messages)
 
 
 def test_indirect_object_max_length():
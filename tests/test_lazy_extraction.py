@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for deferred widget attribute extraction.
+
+These tests verify that constructing a PdfWrapper leaves the secondary
+attribute reads (tooltip, text value, max length, multiline flag)
+deferred, and that they resolve correctly on first access.
+"""
+
+import warnings
+
+from PyPDFForm import PdfWrapper
+
+
+def test_construction_leaves_extraction_deferred(template_stream):
+    """Test that a fresh wrapper has not materialized any widget attributes."""
+    obj = PdfWrapper(template_stream)
+
+    # if anything during construction iterates the widget dict, this
+    # drains and laziness is silently lost
+    assert len(obj.widgets._pending) == len(obj.widgets)  # noqa: SLF001
+
+
+def test_single_access_resolves_single_widget(template_stream):
+    """Test that looking up one widget only materializes that widget."""
+    obj = PdfWrapper(template_stream)
+    pending_before = len(obj.widgets._pending)  # noqa: SLF001
+
+    obj.widgets["test"]  # pylint: disable=W0104
+
+    assert "test" not in obj.widgets._pending  # noqa: SLF001
+    assert len(obj.widgets._pending) == pending_before - 1  # noqa: SLF001
+
+
+def test_failed_deferred_extraction_keeps_widget(template_stream, monkeypatch):
+    """Test that a failure during deferred extraction keeps the widget."""
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter("always")
+
+        def mock_get_text_field_max_length(widget):
+            raise ValueError("Simulated attribute extraction error")  # noqa: TRY003, EM101
+
+        monkeypatch.setattr(
+            "PyPDFForm.template.get_text_field_max_length",
+            mock_get_text_field_max_length,
+        )
+        obj = PdfWrapper(template_stream)
+
+        # the failure surfaces on first access, not during construction
+        widget = obj.widgets["test"]
+
+        # the widget survives with default attributes and the user is warned
+        assert widget.max_length is None
+        warning_messages = [str(warning.message) for warning in w]
+        assert any("attributes may be incomplete" in msg for msg in warning_messages)
+
+
+def test_deferred_attributes_resolve_correctly(template_stream):
+    """Test that deferred and eager access yield the same attributes."""
+    lazy = PdfWrapper(template_stream)
+    eager = PdfWrapper(template_stream)
+    eager.widgets.materialize_all()
+
+    for key in eager.widgets:
+        assert lazy.widgets[key].tooltip == eager.widgets[key].tooltip
+        assert lazy.widgets[key].value == eager.widgets[key].value
@@ -7,7 +7,10 @@ when setting widget values without crashing. The core principle: skip
 faulty widget fills, warn the user, and continue processing.
 """
 
+import warnings
+
 from PyPDFForm import PdfWrapper
+from PyPDFForm.middleware.text import Text
 
 
 def test_fill_with_nonexistent_widget(template_stream):
@@ -61,3 +64,24 @@ def test_fill_with_none_values(sample_template_with_dropdown):
         result = obj.fill({widget_keys[0]: None})
 
         assert result is not None
+
+
+def test_fill_with_failing_value_setter(template_stream, monkeypatch):
+    """Test that a widget whose value setter raises is skipped with a warning."""
+    obj = PdfWrapper(template_stream)
+
+    def raising_setter(self, value):
+        raise ValueError("Simulated value assignment error")  # noqa: TRY003, EM101
+
+    monkeypatch.setattr(
+        Text, "value", property(Text.value.fget, raising_setter)
+    )
+
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter("always")
+
+        result = obj.fill({"test": "some_value"})
+
+        assert result is not None
+        warning_messages = [str(warning.message) for warning in w]
+        assert any("Failed to set value" in msg for msg in warning_messages)
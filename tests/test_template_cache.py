@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the parsed-template cache.
+
+These tests verify that repeated PdfWrapper instantiation with the same
+template bytes reuses the cached parse, that the handed-out widget
+dictionaries stay independent of each other, and that the cache can be
+cleared explicitly.
+"""
+
+from PyPDFForm import PdfWrapper, clear_template_cache
+from PyPDFForm.template import template_cache_size
+from PyPDFForm.widgets.text import TextField
+
+
+def test_repeated_instantiation_uses_cache(template_stream):
+    """Test that the second construction from the same bytes hits the cache."""
+    clear_template_cache()
+
+    obj1 = PdfWrapper(template_stream)
+    assert template_cache_size() == 1
+
+    obj2 = PdfWrapper(template_stream)
+    assert template_cache_size() == 1
+
+    assert set(obj1.widgets.keys()) == set(obj2.widgets.keys())
+
+
+def test_cached_instances_are_independent(template_stream):
+    """Test that filling one wrapper does not leak into another."""
+    obj1 = PdfWrapper(template_stream)
+    obj2 = PdfWrapper(template_stream)
+
+    obj1.fill({"test": "filled value"})
+
+    assert obj1.widgets["test"].value == "filled value"
+    assert obj2.widgets["test"].value != "filled value"
+
+
+def test_rebuilds_do_not_touch_the_cache(template_stream):
+    """Test that mutations do not insert intermediate streams into the cache."""
+    clear_template_cache()
+
+    obj = PdfWrapper(template_stream)
+    assert template_cache_size() == 1
+
+    obj.create_field(TextField(name="new_field", page_number=1, x=10, y=10))
+    assert template_cache_size() == 1
+
+    obj.fill({"test": "value"})
+    assert template_cache_size() == 1
+
+    obj.update_widget_key("new_field", "renamed_field")
+    assert template_cache_size() == 1
+
+
+def test_full_widget_name_is_part_of_the_key(template_stream):
+    """Test that use_full_widget_name variants get separate cache entries."""
+    clear_template_cache()
+
+    PdfWrapper(template_stream)
+    PdfWrapper(template_stream, use_full_widget_name=True)
+
+    assert template_cache_size() == 2
+
+
+def test_clear_template_cache(template_stream):
+    """Test that clearing the cache forces a fresh parse."""
+    obj1 = PdfWrapper(template_stream)
+    assert template_cache_size() > 0
+
+    clear_template_cache()
+    assert template_cache_size() == 0
+
+    obj2 = PdfWrapper(template_stream)
+    assert set(obj1.widgets.keys()) == set(obj2.widgets.keys())
@@ -7,26 +7,20 @@ the same results as calling copy_watermark_widgets multiple times,
 but with better performance.
 """
 
-from io import BytesIO
-
 import pytest
-from pypdf import PdfWriter
 
 from PyPDFForm import PdfWrapper
+from PyPDFForm.template import scan_widget_names
+from PyPDFForm.watermark import merge_watermarks_with_pdf
 from PyPDFForm.widgets.base import Widget
 from PyPDFForm.widgets.text import TextField, TextWidget
 
+from _blank_pdf import blank_pdf
+
 
 def create_blank_pdf(num_pages=1):
     """Create a blank PDF with the specified number of pages."""
-    pdf_writer = PdfWriter()
-    for _ in range(num_pages):
-        pdf_writer.add_blank_page(width=612, height=792)  # Letter size
-
-    output = BytesIO()
-    pdf_writer.write(output)
-    output.seek(0)
-    return output.read()
+    return blank_pdf(num_pages)
 
 
 def test_batch_single_widget():
@@ -118,6 +112,41 @@ def test_batch_multiple_pages():
         assert len(watermarks[i]) > 0
 
 
+def test_batch_many_pages_uses_parallel_rendering():
+    """Test batch rendering above the thread pool threshold."""
+    blank_pdf = create_blank_pdf(6)
+
+    widgets = [
+        TextWidget(
+            name=f"page{page}_field",
+            page_number=page,
+            x=10,
+            y=10,
+            width=100,
+            height=20
+        )
+        for page in range(1, 7)
+    ]
+
+    watermarks = Widget.bulk_watermarks(widgets, blank_pdf)
+
+    # all 6 pages cross PARALLEL_RENDER_MIN_PAGES, and each page must
+    # still come back in its own slot with rendered content
+    assert len(watermarks) == 6
+    for i in range(6):
+        assert len(watermarks[i]) > 0
+
+
+def test_merge_all_empty_watermarks_returns_stream_unchanged():
+    """Test that merging an all-empty watermark list is a no-op."""
+    blank_pdf = create_blank_pdf(2)
+
+    merged = merge_watermarks_with_pdf(blank_pdf, [b"", b""])
+
+    # the stream is handed back as-is, without a parse/serialize round trip
+    assert merged is blank_pdf
+
+
 def test_batch_vs_sequential_functional_equivalence():
     """
     Comprehensive test that batch and sequential methods produce
@@ -163,3 +192,11 @@ def test_batch_vs_sequential_functional_equivalence():
     for i in range(10):
         assert obj_sequential.widgets[f"field{i}"].value == f"value{i}"
         assert obj_batch.widgets[f"field{i}"].value == f"value{i}"
+
+    # both outputs contain every field; the raw scan checks existence
+    # without a full re-parse of either stream
+    sequential_names = set(scan_widget_names(obj_sequential.read()))
+    batch_names = set(scan_widget_names(obj_batch.read()))
+    for i in range(10):
+        assert f"field{i}" in sequential_names
+        assert f"field{i}" in batch_names